@@ -1,81 +1,182 @@
+from __future__ import annotations
+
 import time
 import random
+from collections import deque
+from threading import Thread
+from typing import TYPE_CHECKING
 
-from pytermgui import terminal, clear, alt_buffer, tim
+from pytermgui import Color, terminal, clear, alt_buffer, tim
 from pytermgui.input import getch_timeout, keys
 
 from .aquarium import Position, Aquarium, Fish, Food
 
+if TYPE_CHECKING:
+    from pytermgui import Recorder
+
 
 def center_x(text: str) -> None:
     return (terminal.width - len(text)) // 2
 
 
 def main() -> None:
-    extra_buffer: list[tuple[float, str]] = []
+    extra_buffer: deque[tuple[float, str]] = deque()
 
     def display_for(timeout: float, text: str) -> None:
         extra_buffer.append((timeout, text))
 
-    aquarium = Aquarium(Position(1, 1), terminal.width, terminal.height)
+    def display_message(timeout: float, message: str, style: str) -> None:
+        display_for(
+            timeout,
+            tim.parse(
+                "[({};{}) {}]{}".format(
+                    terminal.height, center_x(message), style, message
+                )
+            ),
+        )
+
+    def save_screenshot(recording: Recorder) -> None:
+        try:
+            recording.save_svg("screenshot.svg", title="Sipedon")
+
+        # A traceback would just be printed over the aquarium
+        except Exception as error:  # pylint: disable=broad-except
+            display_message(
+                1.5, f"Couldn't save screenshot ({type(error).__name__})", "bold error"
+            )
+            return
+
+        display_message(0.7, "Screenshot saved!", "bold primary")
 
-    for _ in range(20):
-        x = random.randint(terminal.origin[0], terminal.width)
-        y = random.randint(terminal.origin[1], terminal.height)
+    aquarium = Aquarium(Position(1, 1), terminal.width, terminal.height)
 
-        aquarium += Fish(pos=Position(x, y))
+    aquarium.extend(
+        Fish(
+            pos=Position(
+                random.randint(terminal.origin[0], terminal.width),
+                random.randint(terminal.origin[1], terminal.height),
+            )
+        )
+        for _ in range(20)
+    )
 
     paused = False
     frametime = 1 / 15
 
+    # Simulation time that hasn't been stepped through yet. We start with one
+    # frame's worth, so the first frame is updated like every other.
+    lag = frametime
+    max_steps = 5
+
+    redraw = True
+    take_screenshot = False
+    exports: list[Thread] = []
+
+    def request_redraw(_: tuple[int, int]) -> None:
+        nonlocal redraw
+        redraw = True
+
+    # Unchanged rows aren't redrawn, so a resize would leave them garbled otherwise
+    terminal.subscribe(terminal.RESIZE, request_redraw)
+
+    # Newer pytermgui versions only report resizes once they are asked to
+    process_resize = getattr(terminal, "process_pending_resize", None)
+
     with alt_buffer(cursor=False, echo=False):
         aquarium.show()
         # time.sleep(0.5)
 
+        previous = time.perf_counter()
+
         while True:
-            if not paused:
+            frame_start = time.perf_counter()
+            lag += frame_start - previous
+            previous = frame_start
+
+            # The simulation runs at a fixed rate, taking extra steps to catch up
+            # when rendering falls behind (but never too many at once).
+            if paused:
+                lag = 0.0
+
+            steps = 0
+            while lag >= frametime and steps < max_steps:
                 aquarium.update()
+                lag -= frametime
+                steps += 1
+
+            if steps == max_steps:
+                lag = 0.0
+
+            if process_resize is not None:
+                process_resize()
+
+            if redraw:
+                clear()
+                aquarium.invalidate()
+
+            # The aquarium only tracks what it drew itself, so while there are
+            # overlays on screen (and right after they expire) we draw everything.
+            redraw = len(extra_buffer) > 0
+
+            frame = [aquarium.render()]
 
-            clear()
+            # Rotate through the buffer in place, dropping expired items. This
+            # keeps anything appended by the screenshot thread in the meantime.
+            for _ in range(len(extra_buffer)):
+                timeout, text = extra_buffer.popleft()
+                if timeout < 0.0:
+                    continue
 
+                frame.append(text)
+                extra_buffer.append((timeout - frametime, text))
+
+            # Everything is written at once, to keep the number of writes down
             with terminal.record() as recording:
-                aquarium.print(flush=False)
+                terminal.write("".join(frame), flush=True)
+
+            # Exporting is slow, so it's done without holding up the next frames
+            if take_screenshot:
+                # Exporting asks the terminal for its default colors. The replies
+                # would race our own input reads from another thread, so they're
+                # queried (and cached by pytermgui) here.
+                Color.default_foreground = Color.get_default_foreground()
+                Color.default_background = Color.get_default_background()
+
+                export = Thread(target=save_screenshot, args=(recording,))
+                export.start()
 
-                for i, (timeout, text) in enumerate(extra_buffer.copy()):
-                    if timeout < 0.0:
-                        extra_buffer.pop(i)
-                        continue
+                exports = [export for export in exports if export.is_alive()]
+                exports.append(export)
 
-                    terminal.write(text)
-                    extra_buffer[i] = timeout - frametime, text
+                take_screenshot = False
 
-            key = getch_timeout(frametime, interrupts=False)
+            # Only wait for whatever is left of this frame's time
+            elapsed = time.perf_counter() - frame_start
+            key = getch_timeout(max(frametime - elapsed, 0.001), interrupts=False)
 
             if key == chr(3):
                 break
 
+            # Screenshots are taken on the next frame, which is drawn in full
             if key == "*":
-                recording.save_svg("screenshot.svg", title="Sipedon")
-                message = "Screenshot saved!"
-
-                display_for(
-                    0.7,
-                    tim.parse(
-                        "[({};{}) bold primary]{}".format(
-                            terminal.height, center_x(message), message
-                        )
-                    ),
-                )
+                take_screenshot = True
+                redraw = True
 
             if key == " ":
                 paused = not paused
 
+            if key == "r":
+                aquarium.clear_type(Food)
+
             if key == keys.ENTER:
                 margin = terminal.width // 5
                 area = range(margin, terminal.width - margin)
 
-                for x in area:
-                    aquarium += Food(pos=Position(x, 3))
+                aquarium.extend(Food(pos=Position(x, 3)) for x in area)
+
+    # Don't leave half-written screenshots behind
+    for export in exports:
+        export.join()
 
     print()
     fish = random.choice(aquarium.fish)
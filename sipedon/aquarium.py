@@ -11,10 +11,13 @@ tangle around in the source.
 
 from __future__ import annotations
 
+import re
 import math
 import random
+from collections import deque
 from dataclasses import dataclass
-from typing import Iterator, Type
+from functools import lru_cache
+from typing import Iterable, Iterator, Sequence, Type, TypeVar
 
 from abc import ABC, abstractmethod
 
@@ -24,11 +27,133 @@ from pytermgui import tim, terminal, real_length
 # Format: \x1b[{y};{x}H{content}
 PositionedStr = str
 
+ChildType = TypeVar("ChildType", bound="AquariumChild")
+
+# Maps every character with a symmetrical pair to its mirror image
+_REVERSE_TABLE = str.maketrans("<>[]{}()/\\dbqp", "><][}{)(\\/bdpq")
+
+# Splits parsed skins into escape sequences & the text between them
+_SEQUENCE = re.compile(r"(\x1b\[[0-9;]*[a-zA-Z])")
+
+
+@lru_cache(maxsize=8192)
+def _get_positioner(xpos: int, ypos: int) -> str:
+    """Returns the ANSI sequence that moves the cursor to the given position.
+
+    The same handful of cells get drawn to every frame, so these are cached
+    rather than formatted again each time.
+    """
+
+    return f"\x1b[{ypos};{xpos}H"
+
+
+@lru_cache(maxsize=1024)
+def _clip_skin(skin: str, skip: int, max_width: int) -> str:
+    """Cuts a parsed skin down to the part that fits on the terminal.
+
+    Anything written past the last column of the terminal would wrap onto the
+    next line, and nothing can be written before its first one. Escape sequences
+    are all kept, so the skin's colors and trailing reset stay in place.
+
+    Args:
+        skin: The parsed skin to clip.
+        skip: The number of visible characters to drop from the start.
+        max_width: The maximum number of visible characters to keep after that.
+
+    Returns:
+        The clipped skin, or `skin` itself if it already fits.
+    """
+
+    if skip == 0 and real_length(skin) <= max_width:
+        return skin
+
+    parts = []
+
+    for part in _SEQUENCE.split(skin):
+        if part.startswith("\x1b"):
+            parts.append(part)
+            continue
+
+        dropped = min(skip, len(part))
+        skip -= dropped
+
+        part = part[dropped : dropped + max_width]
+        max_width -= len(part)
+        parts.append(part)
+
+    return "".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _get_blank(skin: str, skip: int, max_width: int) -> str:
+    """Returns the whitespace needed to erase the given skin.
+
+    Measuring a skin means stripping its markup, which is worth avoiding for
+    every child that gets erased.
+
+    Args:
+        skin: The parsed skin to erase.
+        skip: The number of cells to leave out from the start, see `_clip_skin`.
+        max_width: The maximum number of cells to erase, see `_clip_skin`.
+    """
+
+    return " " * max(min(real_length(skin) - skip, max_width), 0)
+
+
+def _iter_ring(center_x: int, center_y: int, radius: int) -> Iterator[tuple[int, int]]:
+    """Iterates over the grid cells that make up a square ring.
+
+    Args:
+        center_x: The x coordinate of the ring's center cell.
+        center_y: The y coordinate of the ring's center cell.
+        radius: The distance of the ring from its center. 0 yields only the center.
+
+    Yields:
+        Every `(x, y)` cell exactly `radius` cells away from the center.
+    """
+
+    if radius == 0:
+        yield center_x, center_y
+        return
+
+    left, right = center_x - radius, center_x + radius
+    top, bottom = center_y - radius, center_y + radius
+
+    for x in range(left, right + 1):
+        yield x, top
+        yield x, bottom
+
+    for y in range(top + 1, bottom):
+        yield left, y
+        yield right, y
+
+
+@lru_cache(maxsize=512)
+def _parse_colored(text: str, color: int) -> str:
+    """Parses `text` with the given color applied, caching the result.
+
+    Skins are re-colored every frame but only ever use a handful of
+    colors, so parsing their markup each time is wasted work.
+
+    Args:
+        text: The text to color.
+        color: The 256-color index to apply.
+
+    Returns:
+        The parsed, ANSI-colored string.
+    """
+
+    return tim.parse(f"[{color}]{text}")
+
 
 @dataclass
 class Position:
     """Object that represents an `x,y` position"""
 
+    # Positions are created all the time, so we don't want them to carry a dict.
+    # `dataclass(slots=True)` would do the same, but needs Python 3.10.
+    __slots__ = ("xcoord", "ycoord")
+
     xcoord: int
     ycoord: int
 
@@ -67,10 +192,7 @@ class Position:
         if not isinstance(other, Position):
             raise TypeError(f"You can only add {type(self)} to {type(self)} objects.")
 
-        s_x, s_y = self
-        o_x, o_y = other
-
-        return Position(s_x + o_x, s_y + o_y)
+        return Position(self.xcoord + other.xcoord, self.ycoord + other.ycoord)
 
     def __sub__(self, other: object) -> Position:
         """Subtracts two positions.
@@ -88,10 +210,19 @@ class Position:
         if not isinstance(other, Position):
             raise TypeError(f"You can only add {type(self)} to {type(self)} objects.")
 
-        s_x, s_y = self
-        o_x, o_y = other
+        return Position(self.xcoord - other.xcoord, self.ycoord - other.ycoord)
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the coordinates of two positions.
 
-        return Position(s_x - o_x, s_y - o_y)
+        This replaces the dataclass-generated method, which builds a tuple out of
+        both positions for every comparison.
+        """
+
+        if not isinstance(other, Position):
+            return NotImplemented
+
+        return self.xcoord == other.xcoord and self.ycoord == other.ycoord
 
     def __iter__(self) -> Iterator[int]:
         """Iterates through coordinates."""
@@ -99,7 +230,13 @@ class Position:
         return iter((self.xcoord, self.ycoord))
 
     def __getitem__(self, item: int) -> int:
-        return [self.xcoord, self.ycoord][item]
+        if item == 0:
+            return self.xcoord
+
+        if item == 1:
+            return self.ycoord
+
+        raise IndexError(item)
 
     def fuzz(self, xfuzz: int = 5, yfuzz: int = 3) -> Position:
         """Returns a position that is _almost_ self.
@@ -114,11 +251,9 @@ class Position:
             A position that has been slightly randomized based on the arguments.
         """
 
-        xpos, ypos = iter(self)
-
         return Position(
-            xpos + random.randint(-xfuzz, xfuzz),
-            ypos + random.randint(-yfuzz, yfuzz),
+            self.xcoord + random.randint(-xfuzz, xfuzz),
+            self.ycoord + random.randint(-yfuzz, yfuzz),
         )
 
     def distance_to(self, other: Position) -> float:
@@ -131,16 +266,30 @@ class Position:
             The (always positive) distance between self and other.
         """
 
-        return abs(
-            math.sqrt(
-                (other.xcoord - self.xcoord) ** 2 + (other.ycoord - self.ycoord) ** 2
-            )
-        )
+        return math.sqrt(self.distance_sq_to(other))
+
+    def distance_sq_to(self, other: Position) -> int:
+        """Calculates the squared distance between two positions.
+
+        This is cheaper than `distance_to`, and is enough for comparing
+        distances against each other.
+
+        Args:
+            other: The Position to compare to.
+
+        Returns:
+            The square of the distance between self and other.
+        """
+
+        diff_x = other.xcoord - self.xcoord
+        diff_y = other.ycoord - self.ycoord
+
+        return diff_x * diff_x + diff_y * diff_y
 
     def to_ansi(self) -> str:
         """Returns an ANSI positioner string."""
 
-        return f"\x1b[{self.ycoord};{self.xcoord}H"
+        return _get_positioner(self.xcoord, self.ycoord)
 
     def __call__(self, text: str) -> str:
         r"""Positions to given string using ANSI sequences.
@@ -158,9 +307,38 @@ class Position:
         return self.to_ansi() + text
 
 
+@lru_cache(maxsize=256)
+def _apply_pigment(skin: str, pigment: tuple[int, ...]) -> str:
+    """Colors each character of a skin with the matching pigment, caching the result.
+
+    Fish commonly share both their skin and pigments, so most calls end up
+    being cache hits.
+
+    Args:
+        skin: The skin to color.
+        pigment: The colors to use for each character. If the skin is longer than
+            this, the last color is used for the rest of it.
+
+    Returns:
+        The parsed, ANSI-colored skin.
+    """
+
+    tags = [f"[{color}]" for color in pigment]
+    last = len(tags) - 1
+
+    buff = "".join(
+        tags[min(i, last)] + ("\\\\" if char == "\\" else char)
+        for i, char in enumerate(skin)
+    )
+
+    return tim.parse(buff)
+
+
 class AquariumChild(ABC):
     """Base class for all children of an aquarium."""
 
+    skin: str
+
     def __init__(self, pos: Position = Position.origin()) -> None:
         """Initialize object"""
 
@@ -174,11 +352,15 @@ class AquariumChild(ABC):
             diff: The Position that should be summed onto every position.
         """
 
-        self.pos += diff
+        if diff.xcoord == 0 and diff.ycoord == 0:
+            return
+
+        pos = self.pos
+        self.pos = Position(pos.xcoord + diff.xcoord, pos.ycoord + diff.ycoord)
 
     def find_closest(
-        self, items: list[AquariumChild], include_self: bool = False
-    ) -> AquariumChild:
+        self, items: list[ChildType], include_self: bool = False
+    ) -> ChildType:
         """Finds the item that is closest to self.
 
         Args:
@@ -194,17 +376,19 @@ class AquariumChild(ABC):
         if len(items) == 0:
             raise ValueError("Cannot find closest in empty list.")
 
-        pre_filtered = items
+        candidates = items
         if not include_self:
-            if all(item is self for item in items):
+            candidates = [item for item in items if item is not self]
+
+            if len(candidates) == 0:
                 raise ValueError(
                     f"Cannot find closest in list {items!r} that contains only self."
                 )
 
-            pre_filtered = filter(lambda cld: cld is not self, items)
-
-        get_distance = self.pos.distance_to
-        return min(pre_filtered, key=lambda cld: get_distance(cld.pos))
+        # Squared distances are ordered the same way as real ones, so there
+        # is no need to take the square root of each.
+        get_distance_sq = self.pos.distance_sq_to
+        return min(candidates, key=lambda cld: get_distance_sq(cld.pos))
 
     @abstractmethod
     def update(self, aquarium: Aquarium) -> bool:
@@ -233,8 +417,8 @@ class Food(AquariumChild):
         super().__init__(pos)
 
         self.pos = pos
-        color = random.choice(self.pigment_pool)
-        self.skin = tim.parse(f"[{color}]{self.char}")
+        self._color = random.choice(self.pigment_pool)
+        self.skin = _parse_colored(self.char, self._color)
         self.endpoint: int | None = None
 
         self.is_static: bool = False
@@ -247,19 +431,27 @@ class Food(AquariumChild):
 
         return len(self.char)
 
-    def _get_x(self) -> int:
-        """Gets the next x movement direction, based on our previous move."""
+    def _get_x(self, roll: int) -> int:
+        """Gets the next x movement direction, based on our previous move.
+
+        Args:
+            roll: A random number in the range [0, 9), its value modulo 3 is used
+                as the direction.
+        """
 
         if self._previous_horizontal == 0:
-            return random.randint(-1, 1)
+            return roll % 3 - 1
 
         return 0
 
     def update(self, aquarium: Aquarium) -> bool:
         """Updates the position & path of this particle."""
 
+        # The color only changes every few frames
         color = max(237, int(255 - self.lifetime / 3))
-        self.skin = tim.parse(f"[{color}]{self.char}")
+        if color != self._color:
+            self._color = color
+            self.skin = _parse_colored(self.char, color)
 
         if self.endpoint is None:
             return False
@@ -268,15 +460,21 @@ class Food(AquariumChild):
             self.is_static = True
             return True
 
-        horizontal = self._get_x()
-        new = self.pos + Position(horizontal, random.choice([0, 0, 1]))
+        # A single draw decides both axes: its remainder picks the horizontal
+        # direction, and its quotient sinks us one cell a third of the time.
+        roll = int(random.random() * 9)
+        horizontal = self._get_x(roll)
+        vertical = 1 if roll < 3 else 0
 
-        competition = aquarium.get_type_at(Food, new)
+        new_x = self.pos.xcoord + horizontal
+        new_y = self.pos.ycoord + vertical
+
+        competition = aquarium.get_food_at(new_x, new_y)
         if competition is not None and competition.is_static:
             self.is_static = True
             return True
 
-        self.pos = new
+        self.pos = Position(new_x, new_y)
         self._previous_horizontal = horizontal
 
         return True
@@ -306,7 +504,9 @@ class Fish(AquariumChild):  # pylint: disable=too-many-instance-attributes
         self.target: Food | None = None
 
         self._skip_frame = False
-        self._path: list[tuple[Position, int]] = []
+        # Steps are stored as (x, y, heading), a Position is only built for
+        # the step currently being taken.
+        self._path: deque[tuple[int, int, int]] = deque()
 
         if pigment is None:
             pigment = self._get_pigment()
@@ -318,37 +518,31 @@ class Fish(AquariumChild):  # pylint: disable=too-many-instance-attributes
     def width(self) -> int:
         """Gets the width of this fish."""
 
-        return real_length(self.skin)
+        return self._width
 
     @property
     def skin(self) -> str:
         """Returns the currently applied (facing & pigmented) skin."""
 
-        return self.skins[self.heading]
+        # Headings are only ever 1 or -1, so we can skip the dict lookup
+        if self.heading == 1:
+            return self._skin_right
+
+        return self._skin_left
 
     @skin.setter
     def skin(self, new: str) -> None:
         """Sets the new skin, applies pigmentations & does the same for the reverse."""
 
-        def _apply_pigment(skin) -> str:
-            """Apply pigment to a skin"""
-
-            buff = ""
-            for i, char in enumerate(skin):
-                if char == "\\":
-                    char += "\\"
-
-                i = min(i, len(self.pigment) - 1)
-                buff += f"[{self.pigment[i]}]{char}"
-
-            return tim.parse(buff)
-
         self._skin = new
+        pigment = tuple(self.pigment)
+
+        self._skin_right = _apply_pigment(new, pigment)
+        self._skin_left = _apply_pigment(self._reverse_skin(new), pigment)
+        self.skins: dict[int, str] = {-1: self._skin_left, 1: self._skin_right}
 
-        self.skins: dict[int, str] = {
-            -1: _apply_pigment(self._reverse_skin(new)),
-            1: _apply_pigment(new),
-        }
+        # Both facings are the same width, and measuring means stripping markup
+        self._width = real_length(self._skin_right)
 
         # TODO: Support multiple lines
         self.height = len(new.splitlines())
@@ -369,28 +563,12 @@ class Fish(AquariumChild):  # pylint: disable=too-many-instance-attributes
             For example, the skin `><'>` would become `<'><` when reversed.
         """
 
-        reversed_skin = ""
-        reversible = ["<>", "[]", "{}", "()", "/\\", "db", "qp"]
-        for char in reversed(skin):
-            for rev in reversible:
-                if char in rev:
-                    new = rev[rev.index(char) - 1]
-                    break
-            else:
-                new = char
-
-            reversed_skin += new
-
-        return reversed_skin
+        return skin[::-1].translate(_REVERSE_TABLE)
 
     def _get_pigment(self) -> list[int]:
         """Gets a list of pigmentations to use by chosing from the pigment pool."""
 
-        pigment = []
-        for _ in range(self.pigment_length):
-            pigment.append(random.choice(self.pigment_pool))
-
-        return pigment
+        return random.choices(self.pigment_pool, k=self.pigment_length)
 
     def update(self, aquarium: Aquarium) -> bool:
         """Updates the position & path of this fish."""
@@ -399,14 +577,17 @@ class Fish(AquariumChild):  # pylint: disable=too-many-instance-attributes
 
         # Try to follow path
         if path_len > 0:
-            self.pos, self.heading = self._path.pop(0)
+            xpos, ypos, self.heading = self._path.popleft()
+            self.pos = Position(xpos, ypos)
             return True
 
         rand = random.random()
 
         # Try to find food
-        if aquarium.has_type(Food):
-            self.target(self.find_closest(aquarium.food))
+        target = aquarium.get_closest_food(self.pos)
+        if target is not None:
+            self.target = target
+            self.update_path(target.pos)
 
         # Try to follow closest fish
         elif rand <= 0.2:
@@ -414,14 +595,16 @@ class Fish(AquariumChild):  # pylint: disable=too-many-instance-attributes
 
         # Try to look around / idle
         elif rand <= 0.5:
-            count = random.randint(2, 6)
+            # Same as `random.randint(2, 6)`, without its call overhead
+            count = 2 + int(random.random() * 5)
             heading = self.heading
+            xpos, ypos = self.pos.xcoord, self.pos.ycoord
 
             for i in range(count):
                 if random.random() < 0.2:
                     heading *= -1
 
-                self._path.append((self.pos, heading))
+                self._path.append((xpos, ypos, heading))
 
         # Request new endpoint from aquarium
         else:
@@ -432,10 +615,16 @@ class Fish(AquariumChild):  # pylint: disable=too-many-instance-attributes
     def move_origin(self, diff: Position) -> None:
         """Moves fish & its path to new position."""
 
+        if diff.xcoord == 0 and diff.ycoord == 0:
+            return
+
         super().move_origin(diff)
 
-        for i, (pos, heading) in enumerate(self._path):
-            self._path[i] = (pos + diff, heading)
+        diff_x, diff_y = diff.xcoord, diff.ycoord
+        self._path = deque(
+            (xpos + diff_x, ypos + diff_y, heading)
+            for xpos, ypos, heading in self._path
+        )
 
         self._skip_frame = True
 
@@ -448,39 +637,38 @@ class Fish(AquariumChild):  # pylint: disable=too-many-instance-attributes
             dest: The position to move to.
         """
 
-        startx, starty = self.pos
-        endx, endy = dest
+        startx, starty = self.pos.xcoord, self.pos.ycoord
+        endx, endy = dest.xcoord, dest.ycoord
 
-        diff = dest - self.pos
+        diff_x = endx - startx
+        diff_y = endy - starty
 
         xlimit, ylimit = self.movelimits
-        if xlimit != -1 and abs(diff.xcoord) > xlimit:
-            sign = 1 if diff.xcoord > 0 else -1
-            endx = startx + sign * xlimit
+        if xlimit != -1 and abs(diff_x) > xlimit:
+            endx = startx + ((diff_x > 0) - (diff_x < 0)) * xlimit
 
-        if ylimit != -1 and abs(diff.ycoord) > ylimit:
-            sign = 1 if diff.ycoord > 0 else -1
-            endy = starty + sign * ylimit
+        if ylimit != -1 and abs(diff_y) > ylimit:
+            endy = starty + ((diff_y > 0) - (diff_y < 0)) * ylimit
 
-        # Get x delta, x direction
+        # Get x delta, x direction (the latter is 0 when there is no delta)
         diffx = abs(endx - startx)
-        intbuff_x = 1 if startx < endx else -1
+        intbuff_x = (startx < endx) - (startx > endx)
 
         # Get y delta, y direction
         diffy = -abs(endy - starty)
-        intbuff_y = 1 if starty < endy else -1
+        intbuff_y = (starty < endy) - (starty > endy)
 
-        # Set heading
-        heading = intbuff_x
+        # Set heading, facing left when moving straight up or down
+        heading = intbuff_x or -1
 
         # Calculate error
         error = diffx + diffy
 
-        self._path = []
-        while True:
-            pos = Position(startx, starty)
+        self._path.clear()
+        append = self._path.append
 
-            self._path.append((pos, heading))
+        while True:
+            append((startx, starty, heading))
             if startx == endx and starty == endy:
                 break
 
@@ -500,6 +688,10 @@ class Aquarium:
 
     poi_update_percent: float = 0.2
 
+    # The side length of the cells food is bucketed into. Smaller cells make
+    # position lookups cheaper, larger ones make nearest-food searches cheaper.
+    _food_cell_size: int = 4
+
     def __init__(
         self, pos: Position | tuple[int, int], width: int, height: int
     ) -> None:
@@ -516,21 +708,63 @@ class Aquarium:
         self.height = height
 
         self.children: list[AquariumChild] = []
+        self._fish: list[Fish] = []
+        self._food: list[Food] = []
+        self._others: list[AquariumChild] = []
+        self._drawn_rows: dict[int, list[tuple[int, str]]] = {}
+
+        # Food is looked up by position every frame, so we keep it bucketed
+        # into a grid. `_food_cells` remembers where each particle was filed.
+        self._food_grid: dict[tuple[int, int], list[Food]] = {}
+        self._food_cells: dict[Food, tuple[int, int]] = {}
+
+        # The (left, right, top, bottom) cells food has been filed under, used to
+        # bound nearest-food searches. This only ever grows until the next reindex.
+        self._food_extent: tuple[int, int, int, int] | None = None
+
         self._poi_calls = 0
         self._poi_target_calls = 0
         self.get_poi()
 
     @property
     def fish(self) -> list[Fish]:
-        """Get all `Fish` from `self.children`"""
+        """Get all `Fish` from `self.children`.
+
+        This list is maintained as children are added & removed, so it should
+        not be mutated directly.
+        """
 
-        return [child for child in self.children if isinstance(child, Fish)]
+        return self._fish
 
     @property
     def food(self) -> list[Food]:
-        """Get all `Fish` from `self.children`"""
+        """Get all `Food` from `self.children`.
+
+        This list is maintained as children are added & removed, so it should
+        not be mutated directly.
+        """
+
+        return self._food
+
+    def _get_children_of(
+        self, ttype: Type[AquariumChild]
+    ) -> Sequence[AquariumChild]:
+        """Gets the children of the given type, using the typed lists if possible.
+
+        Args:
+            ttype: The type to look for.
+
+        Returns:
+            The children that are instances of `ttype`.
+        """
+
+        if ttype is Fish:
+            return self._fish
+
+        if ttype is Food:
+            return self._food
 
-        return [child for child in self.children if isinstance(child, Food)]
+        return [child for child in self.children if isinstance(child, ttype)]
 
     def has_type(self, ttype: Type[AquariumChild]) -> bool:
         """Return whether this aquarium contains contains any of the given type.
@@ -542,6 +776,12 @@ class Aquarium:
             True if any of the given type is a child of this aquarium.
         """
 
+        if ttype is Fish:
+            return bool(self._fish)
+
+        if ttype is Food:
+            return bool(self._food)
+
         return any(isinstance(child, ttype) for child in self.children)
 
     def get_poi(self) -> Position:
@@ -568,14 +808,18 @@ class Aquarium:
         return self._poi.fuzz()
 
     def __iadd__(self, other: object) -> Aquarium:
-        """Calls `add` with the given object."""
+        """Adds the given object, like `add`.
+
+        Raises:
+            TypeError: Non-AquariumChild object given as `other`.
+        """
 
         if not isinstance(other, AquariumChild):
             raise TypeError(
                 f"You can only add `AquariumChild`-s to `{type(self)}` objects"
             )
 
-        self.add(other)
+        self._insert([other])
 
         return self
 
@@ -593,25 +837,57 @@ class Aquarium:
 
         return pos
 
-    def clamp(self, child: AquariumChild) -> None:
+    def _get_bounds(self) -> tuple[int, int, int, int]:
+        """Gets the area children are clamped within.
+
+        Returns:
+            A tuple of `(x_min, x_max, y_min, y_max)`. Note that `x_max` doesn't
+            take any child's width into account, so it should be offset by it.
+        """
+
+        xpos, ypos = self.pos.xcoord, self.pos.ycoord
+
+        return xpos - 1, xpos + self.width + 1, ypos, ypos + self.height - 1
+
+    def clamp(
+        self,
+        child: AquariumChild,
+        bounds: tuple[int, int, int, int] | None = None,
+    ) -> None:
         """Clamps a child's coordinates within the aquarium.
 
         Args:
             child: The child to clamp.
+            bounds: The bounds to clamp within, as returned by `_get_bounds`. Used
+                so callers clamping many children only have to compute them once.
         """
 
-        child.pos.xcoord = max(
-            min(self.pos.xcoord + self.width - child.width + 1, child.pos.xcoord),
-            self.pos.xcoord - 1,
-        )
+        x_min, x_max, y_min, y_max = bounds or self._get_bounds()
+        x_max -= child.width
+        pos = child.pos
 
-        child.pos.ycoord = max(
-            min(self.pos.ycoord + self.height - 1, child.pos.ycoord),
-            self.pos.ycoord,
-        )
+        xpos, ypos = pos.xcoord, pos.ycoord
+
+        # Nearly every child is in bounds, so skip the writes when possible
+        if x_min <= xpos <= x_max and y_min <= ypos <= y_max:
+            return
+
+        # Same as `max(min(x_max, xpos), x_min)`, without the builtin calls
+        if xpos > x_max:
+            xpos = x_max
+        if xpos < x_min:
+            xpos = x_min
+
+        if ypos > y_max:
+            ypos = y_max
+        if ypos < y_min:
+            ypos = y_min
+
+        pos.xcoord = xpos
+        pos.ycoord = ypos
 
     def add(self, other: AquariumChild, randomize_pos: bool = False) -> None:
-        """Sums two positions.
+        """Adds a child to the aquarium.
 
         Args:
             other: The object to add.
@@ -622,23 +898,224 @@ class Aquarium:
             TypeError: Non-AquariumChild object given as `other`.
         """
 
-        if not isinstance(other, AquariumChild):
-            raise TypeError(
-                f"You can only add object of type AquariumChild to aquariums, not {other!r}."
+        self.extend((other,), randomize_pos)
+
+    def extend(
+        self, others: Iterable[AquariumChild], randomize_pos: bool = False
+    ) -> None:
+        """Adds many children at once.
+
+        This is cheaper than calling `add` for each of them, as fish are only
+        assigned a new target once, no matter how much food is added.
+
+        Args:
+            others: The objects to add.
+            randomize_pos: If set, the position of every given fish will be randomized
+                within the bounds of the aquarium.
+
+        Raises:
+            TypeError: Non-AquariumChild object given in `others`.
+        """
+
+        others = list(others)
+
+        for other in others:
+            if not isinstance(other, AquariumChild):
+                raise TypeError(
+                    f"You can only add object of type AquariumChild to aquariums, not {other!r}."
+                )
+
+        self._insert(others, randomize_pos)
+
+    def _insert(self, others: list[AquariumChild], randomize_pos: bool = False) -> None:
+        """Adds already type-checked children to all of our lists & indices.
+
+        Args:
+            others: The children to add.
+            randomize_pos: If set, the position of every given fish will be randomized
+                within the bounds of the aquarium.
+        """
+
+        self.children.extend(others)
+
+        endpoint = self.pos.ycoord + self.height - 1
+        new_food: Food | None = None
+
+        for other in others:
+            if isinstance(other, Fish):
+                self._fish.append(other)
+
+                if randomize_pos:
+                    other.pos = self._get_destination(other)
+
+            elif isinstance(other, Food):
+                self._food.append(other)
+                self._index_food(other)
+                other.endpoint = endpoint
+                new_food = other
+
+            else:
+                self._others.append(other)
+
+        # Every third fish goes after the newest food
+        if new_food is not None:
+            for fish in self._fish[::3]:
+                fish.target = new_food
+
+    def clear_type(self, ttype: Type[AquariumChild]) -> None:
+        """Removes all children of the given type.
+
+        The child lists are rebuilt in a single pass, instead of removing each
+        child one by one.
+
+        Args:
+            ttype: The type of children to remove.
+        """
+
+        self.children = [
+            child for child in self.children if not isinstance(child, ttype)
+        ]
+        self._fish = [fish for fish in self._fish if not isinstance(fish, ttype)]
+        self._food = [food for food in self._food if not isinstance(food, ttype)]
+        self._others = [
+            other for other in self._others if not isinstance(other, ttype)
+        ]
+
+        self._reindex_food()
+
+        for fish in self._fish:
+            if isinstance(fish.target, ttype):
+                fish.target = None
+
+    def _reindex_food(self) -> None:
+        """Rebuilds the food grid from scratch, using the current food list."""
+
+        self._food_grid = {}
+        self._food_cells = {}
+        self._food_extent = None
+
+        for food in self._food:
+            self._index_food(food)
+
+    def _index_food(self, food: Food) -> None:
+        """Files the given food particle under the cell of its current position."""
+
+        size = self._food_cell_size
+        cell_x, cell_y = food.pos.xcoord // size, food.pos.ycoord // size
+
+        self._food_grid.setdefault((cell_x, cell_y), []).append(food)
+        self._food_cells[food] = (cell_x, cell_y)
+
+        extent = self._food_extent
+        if extent is None:
+            self._food_extent = (cell_x, cell_x, cell_y, cell_y)
+            return
+
+        left, right, top, bottom = extent
+        if not (left <= cell_x <= right and top <= cell_y <= bottom):
+            self._food_extent = (
+                min(left, cell_x),
+                max(right, cell_x),
+                min(top, cell_y),
+                max(bottom, cell_y),
             )
 
-        self.children.append(other)
+    def _unindex_food(self, food: Food) -> None:
+        """Removes the given food particle from the position index."""
+
+        cell = self._food_cells.pop(food)
+        bucket = self._food_grid[cell]
+
+        bucket.remove(food)
+        if len(bucket) == 0:
+            del self._food_grid[cell]
 
-        if isinstance(other, Food):
-            other.endpoint = self.pos.ycoord + self.height - 1
+    def _move_food(self, food: Food) -> None:
+        """Re-files the given food particle if it changed cells since being indexed."""
 
-            for i, fish in enumerate(self.fish):
-                if i % 3 == 0:
-                    fish.target = other
+        size = self._food_cell_size
+        if self._food_cells[food] == (food.pos.xcoord // size, food.pos.ycoord // size):
             return
 
-        if isinstance(other, Fish) and randomize_pos:
-            other.pos = self._get_destination(other)
+        self._unindex_food(food)
+        self._index_food(food)
+
+    def get_food_at(self, xpos: int, ypos: int) -> Food | None:
+        """Tries to find a food particle at the given coordinates.
+
+        This is the same as `get_type_at(Food, ...)`, but doesn't need a
+        Position to be built for the lookup.
+
+        Args:
+            xpos: The x coordinate to look at.
+            ypos: The y coordinate to look at.
+
+        Returns:
+            The food particle if one is found, None otherwise.
+        """
+
+        size = self._food_cell_size
+
+        for food in self._food_grid.get((xpos // size, ypos // size), ()):
+            if food.pos.xcoord == xpos and food.pos.ycoord == ypos:
+                return food
+
+        return None
+
+    def get_closest_food(self, pos: Position) -> Food | None:
+        """Finds the food particle closest to the given position.
+
+        The food grid is searched in growing square rings of cells around `pos`,
+        stopping once no unsearched cell could hold anything closer than the
+        best match so far, or once the rings cover every cell food was filed under.
+
+        Args:
+            pos: The position to search around.
+
+        Returns:
+            The closest food particle, or None if there is no food.
+        """
+
+        remaining = len(self._food)
+        if remaining == 0 or self._food_extent is None:
+            return None
+
+        size = self._food_cell_size
+        grid = self._food_grid
+        xpos, ypos = pos.xcoord, pos.ycoord
+        cell_x, cell_y = xpos // size, ypos // size
+
+        # `remaining` only reaches 0 if the grid agrees with `self._food`, so
+        # the search is also bounded by the area the grid actually covers.
+        left, right, top, bottom = self._food_extent
+        last_ring = max(cell_x - left, right - cell_x, cell_y - top, bottom - cell_y)
+
+        closest: Food | None = None
+        closest_distance = 0
+        ring = 0
+
+        while remaining > 0 and ring <= last_ring:
+            # Anything in this ring is at least this far away on one of the axes
+            if closest is not None and ring > 0:
+                bound = (ring - 1) * size + 1
+                if bound * bound >= closest_distance:
+                    break
+
+            for cell in _iter_ring(cell_x, cell_y, ring):
+                for food in grid.get(cell, ()):
+                    remaining -= 1
+
+                    diff_x = food.pos.xcoord - xpos
+                    diff_y = food.pos.ycoord - ypos
+                    distance = diff_x * diff_x + diff_y * diff_y
+
+                    if closest is None or distance < closest_distance:
+                        closest = food
+                        closest_distance = distance
+
+            ring += 1
+
+        return closest
 
     def get_type_at(
         self, ttype: Type[AquariumChild], pos: Position
@@ -653,10 +1130,10 @@ class Aquarium:
             The child if one is found, None otherwise.
         """
 
-        for child in self.children:
-            if not isinstance(child, ttype):
-                continue
+        if ttype is Food:
+            return self.get_food_at(pos.xcoord, pos.ycoord)
 
+        for child in self._get_children_of(ttype):
             if child.pos == pos:
                 return child
 
@@ -672,63 +1149,163 @@ class Aquarium:
         diff = new - self.pos
         self.pos = new
 
+        if diff.xcoord == 0 and diff.ycoord == 0:
+            return
+
         for child in self.children:
             child.move_origin(diff)
 
+        self._reindex_food()
+
     def update(self) -> bool:
         """Updates all of our children.
 
         At the moment, this always returns True.
         """
 
-        for child in self.children:
-            if not child.update(self):
-                if isinstance(child, Food):
-                    self.children.remove(child)
-                    continue
+        bounds = self._get_bounds()
+
+        # The typed lists already tell us what each child is, so no `isinstance`
+        # checks (or concatenated copies of the lists) are needed here.
+        for children in (self._fish, self._others):
+            for child in children:
+                child.update(self)
+                self.clamp(child, bounds)
+                child.lifetime += 1
+
+        alive: list[Food] = []
+        for food in self._food:
+            if not food.update(self):
+                self._unindex_food(food)
+                continue
 
-            self.clamp(child)
-            child.lifetime += 1
+            self.clamp(food, bounds)
+            self._move_food(food)
+            food.lifetime += 1
+
+            alive.append(food)
+
+        # Removing while iterating would skip children, so we drop the dead
+        # ones all at once instead.
+        if len(alive) != len(self._food):
+            dead = set(self._food).difference(alive)
+
+            self._food = alive
+            self.children = [child for child in self.children if child not in dead]
 
         return True
 
-    def get_content(self) -> list[tuple[tuple[int, int], str]]:
+    def get_content(self) -> list[tuple[Position, str]]:
         """Gets a list of all of our children's position & skin.
 
+        This isn't used for drawing, `render` reads the children directly.
+
         Returns:
             A list of tuples with (child.pos, child.skin).
         """
 
-        content = []
-        for child in self.children:
-            content.append((child.pos, child.skin))
-
-        return content
+        return [(child.pos, child.skin) for child in self.children]
 
     def show(self) -> None:
         """Shows the space occupied by the terminal, using print."""
 
-        buff = ""
-        for x in range(0, self.width):
-            x += self.pos.xcoord
+        left, top = self.pos.xcoord, self.pos.ycoord
 
-            for y in range(0, self.height):
-                y += self.pos.ycoord
-
-                buff += f"\x1b[{y};{x}H{'#' if x % 2 else 'x'}"
+        # Every row looks the same, so it's built once and written line by line
+        row = "".join("#" if x % 2 else "x" for x in range(left, left + self.width))
+        buff = "".join(
+            _get_positioner(left, y) + row for y in range(top, top + self.height)
+        )
 
         print(buff, end="", flush=True)
 
+    def invalidate(self) -> None:
+        """Forgets what was drawn previously, so the next `render` draws everything.
+
+        This should be called whenever the screen was cleared or drawn over by
+        something other than this aquarium.
+        """
+
+        self._drawn_rows = {}
+
+    def render(self) -> str:
+        """Renders all children that changed since the last call.
+
+        Only rows whose content differs from the previous call are included. For
+        those, the previously drawn children are erased and the current ones are
+        drawn in their place, so the screen doesn't need to be cleared between
+        frames. Calling this on an unchanged aquarium returns an empty string.
+
+        This assumes that the output of every call was written to the terminal,
+        and nothing else drew over it since. Call `invalidate` when that isn't
+        the case, e.g. after the screen was cleared.
+
+        Returns:
+            A string of positioned skins, ready to be written to the terminal
+            in one go.
+        """
+
+        # Children are positioned in terminal coordinates, but may reach a cell
+        # past either side of it.
+        last_column = terminal.width
+        last_line = terminal.height
+
+        rows: dict[int, list[tuple[int, str]]] = {}
+        for child in self.children:
+            pos = child.pos
+
+            # `setdefault` would build a throwaway list for every child
+            row = rows.get(pos.ycoord)
+            if row is None:
+                row = rows[pos.ycoord] = []
+
+            row.append((pos.xcoord, child.skin))
+
+        previous = self._drawn_rows
+        buff: list[str] = []
+
+        for ypos, content in previous.items():
+            if rows.get(ypos) == content or not 1 <= ypos <= last_line:
+                continue
+
+            for xpos, skin in content:
+                skip = max(1 - xpos, 0)
+                blank = _get_blank(skin, skip, last_column - xpos - skip + 1)
+
+                if len(blank) > 0:
+                    buff.append(_get_positioner(xpos + skip, ypos) + blank)
+
+        for ypos, content in rows.items():
+            if previous.get(ypos) == content or not 1 <= ypos <= last_line:
+                continue
+
+            for xpos, skin in content:
+                if xpos > last_column:
+                    continue
+
+                skip = max(1 - xpos, 0)
+                skin = _clip_skin(skin, skip, last_column - xpos - skip + 1)
+
+                # Parsed skins already end with a reset, don't send another
+                if not skin.endswith("\x1b[0m"):
+                    skin += "\x1b[0m"
+
+                buff.append(_get_positioner(xpos + skip, ypos) + skin)
+
+        self._drawn_rows = rows
+
+        return "".join(buff)
+
     def print(self, flush: bool = False) -> None:
-        """Prints all children.
+        """Draws every child to the terminal.
+
+        This always draws the full aquarium, so it can be used on a freshly
+        cleared screen. Use `render` to only draw what changed.
 
         Args:
             flush: If set, the terminal's stream will be flushed at the end
                 of this routine.
         """
 
-        for pos, skin in self.get_content():
-            terminal.write(skin, pos=pos)
-
-        if flush:
-            terminal.flush()
+        self.invalidate()
+        terminal.write(self.render(), flush=flush)
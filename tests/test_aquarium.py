@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import re
+import random
+from typing import Iterator
+
+import pytest
+from pytermgui import real_length, terminal
+
+from sipedon.aquarium import Aquarium, Fish, Food, Position
+
+RE_POSITIONER = re.compile(r"\x1b\[(\d+);(\d+)H")
+
+
+def _random_position(rng: random.Random, width: int, height: int) -> Position:
+    return Position(rng.randint(1, width), rng.randint(1, height))
+
+
+def _assert_food_indexed(aquarium: Aquarium) -> None:
+    """Asserts that the food grid holds exactly the aquarium's food."""
+
+    size = aquarium._food_cell_size
+
+    assert set(aquarium._food_cells) == set(aquarium.food)
+    assert sum(len(bucket) for bucket in aquarium._food_grid.values()) == len(
+        aquarium.food
+    )
+
+    for food in aquarium.food:
+        cell = (food.pos.xcoord // size, food.pos.ycoord // size)
+
+        assert aquarium._food_cells[food] == cell
+        assert food in aquarium._food_grid[cell]
+
+
+def _assert_closest_food(aquarium: Aquarium, rng: random.Random) -> None:
+    """Compares `get_closest_food` against a brute-force scan."""
+
+    for _ in range(20):
+        pos = Position(rng.randint(-10, aquarium.width + 10), rng.randint(-10, 50))
+        closest = aquarium.get_closest_food(pos)
+
+        if len(aquarium.food) == 0:
+            assert closest is None
+            continue
+
+        assert closest is not None
+        assert closest.pos.distance_sq_to(pos) == min(
+            food.pos.distance_sq_to(pos) for food in aquarium.food
+        )
+
+
+def _iter_states(seed: int) -> Iterator[tuple[Aquarium, random.Random]]:
+    """Yields the same aquarium after each kind of operation that moves food."""
+
+    random.seed(seed)
+    rng = random.Random(seed)
+
+    aquarium = Aquarium(Position(1, 1), 100, 40)
+    aquarium.extend(Fish(pos=_random_position(rng, 100, 40)) for _ in range(5))
+    aquarium.extend(
+        Food(pos=_random_position(rng, 100, 40)) for _ in range(rng.randint(1, 80))
+    )
+    yield aquarium, rng
+
+    for _ in range(rng.randint(1, 30)):
+        aquarium.update()
+    yield aquarium, rng
+
+    aquarium.move(Position(rng.randint(-5, 5), rng.randint(-5, 5)))
+    yield aquarium, rng
+
+    aquarium.extend(Food(pos=Position(xpos, 3)) for xpos in range(20, 40))
+    yield aquarium, rng
+
+    for _ in range(rng.randint(1, 30)):
+        aquarium.update()
+    yield aquarium, rng
+
+    aquarium.clear_type(Food)
+    yield aquarium, rng
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_food_index_matches_food(seed: int) -> None:
+    for aquarium, _ in _iter_states(seed):
+        _assert_food_indexed(aquarium)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_closest_food_matches_brute_force(seed: int) -> None:
+    for aquarium, rng in _iter_states(seed):
+        _assert_closest_food(aquarium, rng)
+
+
+def _parse_output(output: str) -> list[tuple[int, int, str]]:
+    """Splits rendered output into `(column, line, text)` segments."""
+
+    parts = RE_POSITIONER.split(output)
+    assert parts[0] == ""
+
+    return [
+        (int(parts[i + 1]), int(parts[i]), parts[i + 2])
+        for i in range(1, len(parts), 3)
+    ]
+
+
+@pytest.fixture
+def terminal_size(monkeypatch: pytest.MonkeyPatch) -> tuple[int, int]:
+    monkeypatch.setattr(terminal, "size", (80, 24))
+    return terminal.size
+
+
+def test_render_draws_settled_food(terminal_size: tuple[int, int]) -> None:
+    random.seed(0)
+    width, height = terminal_size
+
+    aquarium = Aquarium(Position(1, 1), width, height)
+    aquarium.extend(Food(pos=Position(xpos, 3)) for xpos in range(10, 30))
+
+    while not all(food.is_static for food in aquarium.food):
+        aquarium.update()
+
+    # The bottom row is where food settles, so it has to be drawn too
+    assert any(food.pos.ycoord == height for food in aquarium.food)
+
+    cells = [
+        (int(column), int(line))
+        for line, column in RE_POSITIONER.findall(aquarium.render())
+    ]
+
+    assert sorted(cells) == sorted(
+        (food.pos.xcoord, food.pos.ycoord) for food in aquarium.food
+    )
+
+
+def test_render_only_redraws_changed_rows(terminal_size: tuple[int, int]) -> None:
+    width, height = terminal_size
+    aquarium = Aquarium(Position(1, 1), width, height)
+
+    fish = Fish(pos=Position(10, 5))
+    food = Food(pos=Position(30, 12))
+    aquarium.extend([fish, food])
+
+    first = _parse_output(aquarium.render())
+    assert [(column, line) for column, line, _ in first] == [(10, 5), (30, 12)]
+    assert aquarium.render() == ""
+
+    fish.pos = Position(12, 7)
+    segments = _parse_output(aquarium.render())
+
+    # The old fish is erased, the new one drawn and the untouched food left alone
+    assert segments == [(10, 5, " " * 4), (12, 7, fish.skin)]
+
+    aquarium.invalidate()
+    assert _parse_output(aquarium.render()) == [(12, 7, fish.skin), (30, 12, food.skin)]
+
+
+def test_render_clips_at_edges(terminal_size: tuple[int, int]) -> None:
+    width, height = terminal_size
+    aquarium = Aquarium(Position(1, 1), width, height)
+
+    left = Fish(pos=Position(0, 3))
+    right = Fish(pos=Position(width - 1, 4))
+    below = Fish(pos=Position(10, height + 1))
+    aquarium.extend([left, right, below])
+
+    segments = _parse_output(aquarium.render())
+    assert [(column, line) for column, line, _ in segments] == [(1, 3), (width - 1, 4)]
+    assert [real_length(text) for _, _, text in segments] == [3, 2]
+
+    left.pos = Position(5, 3)
+    right.pos = Position(5, 4)
+    segments = _parse_output(aquarium.render())
+
+    assert (1, 3, " " * 3) in segments
+    assert (width - 1, 4, " " * 2) in segments